@@ -5,154 +5,292 @@
 """
 Electoral Roll Data Extraction Tool
 - Supports CLI (argparse) and GUI (tkinter)
-- Parses multi-column Hindi electoral PDFs using pdfplumber with regex heuristics
-- Consolidates to a single Excel
+- Parses multi-column Hindi electoral PDFs using PyMuPDF (pdfplumber fallback) with regex heuristics
+- Consolidates to a single Excel, or a Parquet dataset partitioned by source PDF
 
 Usage (CLI):
   python extract.py --input "C:\folder\rolls" --output "C:\out\final_output.xlsx"
+  python extract.py --input "C:\folder\rolls" --output "C:\out\rolls_parquet" --format parquet
 
 GUI:
   python extract.py --gui
 """
 import os, re, sys, argparse, glob
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import chain, islice, repeat
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import pandas as pd
 
+# Optional backends; whichever is installed is used
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Arrow-backed strings keep text columns in contiguous buffers
+string_dtype = pd.StringDtype("pyarrow") if pyarrow is not None else str
+
 # ---------- Normalization ----------
+# Only whitespace runs that are not already a single space, so clean text
+# passes through without being rebuilt
+ws_re = re.compile(r"[\t\xa0][ \t\xa0]*| [ \t\xa0]+")
+
 def norm(s: str) -> str:
     if not isinstance(s, str):
         return s
-    s = re.sub(r"[ \t]+", " ", s)
-    s = re.sub(r"[ \xa0]+", " ", s)
-    return s.replace("\u200c","").replace("\u200b","").strip()
-
-def norm_gender(g: str) -> str:
-    g = norm(g)
-    if "पुरुष" in g or "परुष" in g or "परुुष" in g:
-        return "Male"
-    if "महिला" in g or "मिहला" in g:
-        return "Female"
-    return g
+    # str.replace returns the string untouched when the character is absent,
+    # which beats str.translate on Devanagari text
+    return ws_re.sub(" ", s).replace("\u200c", "").replace("\u200b", "").strip()
+
+gender_map = {"पुरुष": "Male", "परुष": "Male", "परुुष": "Male", "पु रुष": "Male", "महिला": "Female", "मिहला": "Female"}
+gender_re = re.compile("(" + "|".join(sorted(map(re.escape, gender_map), key=len, reverse=True)) + ")")
+# पित / िपता are pdfplumber's glyph order for पति / पिता
+rel_map = {"पिता": "Father", "िपता": "Father", "पति": "Husband", "पित": "Husband", "पत्नी": "Wife", "माता": "Mother"}
 
 # ---------- Regex ----------
 serial_epic_re = re.compile(r"^\s*(\d{1,4})\s+([A-Z]{2,4}[/A-Z0-9-]*\d{3,})\b")
-stop_tokens = r"(?:िनवार्चक का नाम|पिता का नाम|पित का नाम|पति का नाम|पत्नी का नाम|माता का नाम|मकान|उम्र|लिंग|\n)"
-name_re = re.compile(r"िनवार्चक का नाम\s*[:：]\s*(.+?)(?=\s*" + stop_tokens + r")")
-rel_re = re.compile(r"(पिता|पित|पति|पत्नी|माता)\s*(?:का\s*नाम)?\s*[:：]?\s*([^\n]+)")   # FIXED
-house_re = re.compile(r"मकान\s*स(?:ं|ंख्या|खं|ख्या)\s*[:：]?\s*(.+?)(?=\s*" + stop_tokens + r")")
-age_gender_re = re.compile(r"उम्र\s*[:：]?\s*(\d{1,3}).*?(?:लि?ं?ग)\s*[:：]?\s*([^\n]+)")
+# Any page with a voter block contains at least this much of an EPIC
+epic_quick_re = re.compile(r"[A-Z]{2,4}[/A-Z0-9-]*\d{3}")
+split_serial_epic_re = re.compile(r"^(\d{1,4})\n(?=[A-Z]{2,4}[/A-Z0-9-]*\d{3,}\b)", re.M)
+stop_tokens = r"(?:िनवार्चक का नाम|निर्वाचक का नाम|पिता का नाम|िपता का नाम|पित का नाम|पति का नाम|पत्नी का नाम|माता का नाम|मकान|उम्र|लिंग|\n)"
+name_pat = r"(?:िनवार्चक|निर्वाचक) का नाम\s*[:：]\s*(?P<name>.+?)(?=\s*" + stop_tokens + r")"
+rel_keys = "|".join(sorted(map(re.escape, rel_map), key=len, reverse=True))
+rel_pat = r"(?P<rel_key>" + rel_keys + r")\s*का\s*नाम\s*[:：]*\s*(?P<rel_name>[^\n]+)"   # FIXED
+house_pat = r"मकान\s*स(?:ं|ंख्या|खं|ख्या)\s*[:：]?\s*(?P<house>.+?)(?=\s*" + stop_tokens + r")"
+age_gender_pat = r"उम्र\s*[:：]?\s*(?P<age>\d{1,3}).*?(?:लि?ं?ग|िलर्\s?ग)\s*[:：]*\s*(?P<gender>[^\n]+)"
+# Kept as separate searches: each pattern starts with a literal, which SRE
+# scans for quickly; a fused alternation loses that and is slower.
+name_re = re.compile(name_pat)
+rel_re = re.compile(rel_pat)
+house_re = re.compile(house_pat)
+age_gender_re = re.compile(age_gender_pat)
+vidhan_re = re.compile(r"(?:िवधानसभा|विधानसभा)[^:]*[:：]\s*([0-9]+)\s*-\s*([^\n(]+)")
+booth_hdr_re = re.compile(r"(भाग\s*सं|भाग\s*संख्या|मतदान\s*कें?द्र|Booth\s*No)")
+booth_val_re = re.compile(r"([0-9]+)\s*[-–]\s*([^\n]+)")
+last_int_re = re.compile(r"(\d+)(?!.*\d)", re.S)
+
+# Low-cardinality output columns, stored as categoricals
+category_cols = ["State Name", "Vidhan sabha Name & Number", "Booth Name & Number", "Relation Type", "Gender"]
 
 # ---------- Helpers ----------
-def split_blocks(text: str) -> List[str]:
+def join_serial_epic(text: str) -> str:
+    # PyMuPDF emits the serial number and EPIC on separate lines
+    return split_serial_epic_re.sub(r"\1 ", text)
+
+def split_blocks(text: str) -> List[List[str]]:
     lines = text.splitlines()
     blocks = []
     current = []
     for line in lines:
-        if serial_epic_re.match(line):
+        # Cheap digit test first; most lines cannot start a block
+        stripped = line.lstrip()
+        if stripped and stripped[0].isdigit() and serial_epic_re.match(line):
             if current:
-                blocks.append("\n".join(current[:20]))
+                blocks.append(current[:20])
                 current = []
         current.append(line)
     if current:
-        blocks.append("\n".join(current[:20]))
+        blocks.append(current[:20])
     return blocks
 
 # ---------- Parser ----------
-def parse_pdf(path: str) -> pd.DataFrame:
-    try:
-        import pdfplumber
-        with pdfplumber.open(path) as pdf:
-            pages_text = [norm(p.extract_text(x_tolerance=2, y_tolerance=2) or "") for p in pdf.pages]
-    except Exception:
-        import PyPDF2
-        reader = PyPDF2.PdfReader(open(path, "rb"))
-        pages_text = [norm(page.extract_text() or "") for page in reader.pages]
+# Per-voter output columns, filled page by page
+voter_cols = ["Voter's Serial Number", "Voter's Name", "Voter ID (EPIC Number)", "Relation's Name",
+              "Relation Type", "House Number", "Age", "Gender"]
+
+# Appends each voter on the page to the column lists, keyed by output column name
+def parse_page_blocks(page_text: str, columns: Dict[str, List[str]]) -> None:
+    # Cover, map and summary pages have no EPIC numbers
+    if not page_text or not epic_quick_re.search(page_text):
+        return
+    for block in split_blocks(page_text):
+        lines = [norm(x) for x in block if x.strip()]
+        if not lines: 
+            continue
+        m_head = serial_epic_re.match(lines[0])
+        if not m_head: 
+            continue
+        serial, epic = m_head.group(1), m_head.group(2)
+        body = "\n".join(lines[1:])
+        name = rel_name = house = age = gender = ""
+        rel_type = ""
+
+        # Name
+        mn = name_re.search(body)
+        if mn:
+            name = norm(mn.group("name"))
+
+        # Relation (FIXED)
+        mr = rel_re.search(body)
+        if mr:
+            rel_name = norm(mr.group("rel_name"))
+            rel_type = rel_map.get(mr.group("rel_key"), "")
+
+        # House
+        mh = house_re.search(body)
+        if mh:
+            house = norm(mh.group("house"))
+            house = house.split("फोटो")[0].strip()
+
+        # Age/Gender
+        mag = age_gender_re.search(body)
+        if mag:
+            age = mag.group("age")
+            gender = mag.group("gender")
+
+        columns["Voter's Serial Number"].append(serial)
+        columns["Voter's Name"].append(name)
+        columns["Voter ID (EPIC Number)"].append(epic)
+        columns["Relation's Name"].append(rel_name)
+        columns["Relation Type"].append(rel_type)
+        columns["House Number"].append(house)
+        columns["Age"].append(age)
+        columns["Gender"].append(gender)
+
+def pymupdf_pages(path: str, start: int) -> Iterator[str]:
+    with pymupdf.open(path) as doc:
+        for i in range(start, doc.page_count):
+            yield join_serial_epic(norm(doc[i].get_text("text") or ""))
+
+def pdfplumber_pages(path: str, start: int) -> Iterator[str]:
+    with pdfplumber.open(path) as pdf:
+        for p in pdf.pages[start:]:
+            text = p.extract_text(x_tolerance=2, y_tolerance=2, use_text_flow=True)
+            p.flush_cache()
+            yield norm(text or "")
+
+def pypdf2_pages(path: str, start: int) -> Iterator[str]:
+    with open(path, "rb") as fh:
+        for page in islice(PyPDF2.PdfReader(fh).pages, start, None):
+            yield norm(page.extract_text() or "")
+
+def pdf_backends() -> List[Tuple[str, Callable[[str, int], Iterator[str]]]]:
+    # Installed libraries, in order of preference
+    found = (("pymupdf", pymupdf, pymupdf_pages), ("pdfplumber", pdfplumber, pdfplumber_pages), ("pypdf2", PyPDF2, pypdf2_pages))
+    return [(name, pages) for name, lib, pages in found if lib is not None]
 
-    header_text = "\n".join(pages_text[:3])
+def iter_pages_text(path: str) -> Iterator[str]:
+    # Yield one page at a time so a large roll is never held in memory whole
+    backends = pdf_backends()
+    if not backends:
+        raise RuntimeError("No PDF library found; install pymupdf or pdfplumber")
+    done = 0
+    for i, (_, pages) in enumerate(backends):
+        try:
+            for text in pages(path, done):
+                yield text
+                done += 1
+            return
+        except Exception:
+            # The next library picks up from the page that failed
+            if i == len(backends) - 1:
+                raise
 
+# Header fields are per file; parsed once from the first pages.
+# Returns the State, Vidhan Sabha and Booth column values.
+def parse_header(header_text: str) -> Tuple[str, str, str]:
     # State
     state = "Bihar" if "बिहार" in header_text or "िबहार" in header_text else "Unknown"
 
-    # Vidhan Sabha
-    m_vs = re.search(r"िवधानसभा[^:]*[:：]\s*([0-9]+)\s*-\s*([^\n(]+)", header_text)
+    # Vidhan Sabha (label and number may be on different lines, so search the whole text)
+    m_vs = vidhan_re.search(header_text)
     vs_num, vs_name = (m_vs.group(1).strip(), norm(m_vs.group(2))) if m_vs else ("", "")
 
     # Booth (Universal Regex)
     booth_num, booth_name = "", ""
     header_lines = header_text.splitlines()
     for idx, line in enumerate(header_lines):
-        if re.search(r"(भाग\s*सं|भाग\s*संख्या|मतदान\s*कें?द्र|Booth\s*No)", line):
+        # Plain substring test before the regex; most header lines have none of these
+        if not ("भाग" in line or "मतदान" in line or "Booth" in line):
+            continue
+        if booth_hdr_re.search(line):
             # Try same line
-            m = re.search(r"([0-9]+)\s*[-–]\s*([^\n]+)", line)
+            m = booth_val_re.search(line)
             if m:
                 booth_num, booth_name = m.group(1).strip(), norm(m.group(2))
                 break
             # Try next line
             if idx + 1 < len(header_lines):
-                m2 = re.search(r"([0-9]+)\s*[-–]\s*([^\n]+)", header_lines[idx+1])
+                m2 = booth_val_re.search(header_lines[idx+1])
                 if m2:
                     booth_num, booth_name = m2.group(1).strip(), norm(m2.group(2))
                     break
 
-    rows = []
-    for page_text in pages_text:
-        for block in split_blocks(page_text):
-            lines = [norm(x) for x in block.splitlines() if x.strip()]
-            if not lines: 
-                continue
-            m_head = serial_epic_re.match(lines[0])
-            if not m_head: 
-                continue
-            serial, epic = m_head.group(1), m_head.group(2)
-            body = "\n".join(lines[1:])
-            name = rel_name = house = age = gender = ""
-            rel_type = ""
-
-            # Name
-            mn = name_re.search(body) 
-            if mn: 
-                name = norm(mn.group(1))
-
-            # Relation (FIXED)
-            mr = rel_re.search(body)
-            if mr:
-                rel_name = norm(mr.group(2))
-                rk = mr.group(1)
-                if "पिता" in rk or "पित" in rk:
-                    rel_type = "Father"
-                elif "पति" in rk:
-                    rel_type = "Husband"
-                elif "पत्नी" in rk:
-                    rel_type = "Wife"
-                elif "माता" in rk:
-                    rel_type = "Mother"
-
-            # House
-            mh = house_re.search(body)
-            if mh:
-                house = norm(mh.group(1))
-                house = house.split("फोटो")[0].strip()
-
-            # Age/Gender
-            mag = age_gender_re.search(body)
-            if mag:
-                age = mag.group(1)
-                gender = norm_gender(mag.group(2))
-
-            rows.append({
-                "State Name": state,
-                "Vidhan sabha Name & Number": f"{vs_num}-{vs_name}" if vs_num else "",
-                "Booth Name & Number": f"{booth_num}-{booth_name}" if booth_num else "Not Found",
-                "Voter's Serial Number": serial,
-                "Voter's Name": name,
-                "Voter ID (EPIC Number)": epic,
-                "Relation's Name": rel_name,
-                "Relation Type": rel_type,
-                "House Number": re.findall(r"\d+", house)[-1] if re.findall(r"\d+", house) else house,
-                "Age": age,
-                "Gender": gender
-            })
-    return pd.DataFrame(rows)
+    vidhan = f"{vs_num}-{vs_name}" if vs_num else ""
+    booth = f"{booth_num}-{booth_name}" if booth_num else "Not Found"
+    return state, vidhan, booth
+
+def parse_pdf(path: str) -> pd.DataFrame:
+    pages = iter_pages_text(path)
+    head = list(islice(pages, 3))
+    state, vidhan, booth = parse_header("\n".join(head))
+
+    columns: Dict[str, List[str]] = {c: [] for c in voter_cols}
+    for page_text in chain(head, pages):
+        parse_page_blocks(page_text, columns)
+
+    n = len(columns["Voter's Serial Number"])
+    df = pd.DataFrame({
+        "State Name": [state] * n,
+        "Vidhan sabha Name & Number": [vidhan] * n,
+        "Booth Name & Number": [booth] * n,
+        **columns,
+    }, dtype=string_dtype)
+
+    # Column-wise post-processing
+    house = df["House Number"]
+    df["House Number"] = house.str.extract(last_int_re, expand=False).fillna(house)
+    gender = df["Gender"].str.strip()
+    df["Gender"] = gender.str.extract(gender_re, expand=False).map(gender_map).fillna(gender).astype(string_dtype)
+    return df.astype({c: "category" for c in category_cols})
+
+# ---------- Cache ----------
+# Bump when parsing changes so stale cached results are not reused
+cache_version = 4
+
+# <pdf>.<mtime>_<size>[.<backend>].v<N>.parquet; nothing else is ever removed
+cache_name_re = r"\.\d+_\d+(?:\.[a-z0-9]+)?\.v\d+\.parquet"
+
+def parse_pdf_cached(path: str) -> pd.DataFrame:
+    # Cached result lives next to the PDF, keyed by its mtime, size and the
+    # library that extracts it, since each gives slightly different text
+    st = os.stat(path)
+    backends = pdf_backends()
+    backend = backends[0][0] if backends else "none"
+    cache_path = f"{path}.{st.st_mtime_ns}_{st.st_size}.{backend}.v{cache_version}.parquet"
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            pass
+    df = parse_pdf(path)
+    try:
+        old_re = re.compile(re.escape(os.path.basename(path)) + cache_name_re)
+        for old in glob.glob(glob.escape(path) + ".*.parquet"):
+            if old_re.fullmatch(os.path.basename(old)):
+                os.remove(old)
+        df.to_parquet(cache_path, index=False)
+    except Exception:
+        # No parquet engine or read-only folder; just skip caching
+        pass
+    return df
 
 # ---------- Helpers for multiple files ----------
 def gather_pdfs(input_path: str) -> List[str]:
@@ -164,21 +302,81 @@ def gather_pdfs(input_path: str) -> List[str]:
         pdfs = []
     return pdfs
 
+def combine_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    if not frames:
+        return pd.DataFrame()
+    # Give each categorical column one shared dtype across files, so concat
+    # only joins the integer codes instead of expanding to full strings
+    dtypes = {}
+    for c in category_cols:
+        cats = [f[c].cat.categories for f in frames if c in f]
+        if cats:
+            dtypes[c] = pd.CategoricalDtype(reduce(lambda a, b: a.union(b), cats))
+    frames = [f.astype({c: t for c, t in dtypes.items() if c in f}) for f in frames]
+    return pd.concat(frames, ignore_index=True, sort=False)
+
+# Rows per worksheet, header included
+excel_max_rows = 1048576
+
+def write_excel(df: pd.DataFrame, path: str) -> None:
+    # xlsxwriter silently skips rows past the limit, so refuse up front
+    if len(df) + 1 > excel_max_rows:
+        raise ValueError(f"This sheet is too large! {len(df)} rows exceed Excel's limit of "
+                         f"{excel_max_rows - 1}; use --format parquet instead.")
+    if xlsxwriter is None:
+        df.to_excel(path, index=False)
+        return
+    # Stream rows to disk; pandas' to_excel writes column by column,
+    # which constant_memory mode cannot handle.
+    with xlsxwriter.Workbook(path, {"constant_memory": True}) as wb:
+        ws = wb.add_worksheet()
+        ws.write_row(0, 0, list(df.columns), wb.add_format({"bold": True}))
+        for r, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            ws.write_row(r, 0, ["" if pd.isna(v) else v for v in row])
+
+def map_pdfs(func, pdfs: List[str], workers: Optional[int] = None, *args, mp_context=None) -> list:
+    # Each PDF is independent, so handle them in separate processes
+    iters = [pdfs] + [repeat(a) for a in args]
+    if workers == 1 or len(pdfs) < 2:
+        return list(map(func, *iters))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as ex:
+        return list(ex.map(func, *iters))
+
+def parse_all(pdfs: List[str], workers: Optional[int] = None, use_cache: bool = True, mp_context=None) -> List[pd.DataFrame]:
+    return map_pdfs(parse_pdf_cached if use_cache else parse_pdf, pdfs, workers, mp_context=mp_context)
+
+def write_parquet_part(path: str, out_dir: str, use_cache: bool = True) -> int:
+    # Runs in the worker: each PDF becomes its own partition, nothing is concatenated
+    df = parse_pdf_cached(path) if use_cache else parse_pdf(path)
+    part_dir = os.path.join(out_dir, "source=" + os.path.splitext(os.path.basename(path))[0])
+    os.makedirs(part_dir, exist_ok=True)
+    df.to_parquet(os.path.join(part_dir, "part.parquet"), index=False)
+    return len(df)
+
 def run_cli(args):
     pdfs = gather_pdfs(args.input)
     if not pdfs:
         print("No PDFs found in input path.")
         sys.exit(1)
-    frames = []
-    for p in pdfs:
-        df = parse_pdf(p)
-        frames.append(df)
-    out_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if args.format == "parquet":
+        # Like pyarrow's write_dataset, never mix in partitions from an earlier run
+        if os.path.isfile(args.output):
+            print(f"Output must be a folder for --format parquet: {args.output}")
+            sys.exit(1)
+        if os.path.isdir(args.output) and os.listdir(args.output):
+            print(f"Output folder is not empty: {args.output}")
+            sys.exit(1)
+        rows = sum(map_pdfs(write_parquet_part, pdfs, args.workers, args.output, not args.no_cache))
+        print(f"Saved: {args.output} ({rows} rows)")
+        return
+    out_df = combine_frames(parse_all(pdfs, args.workers, not args.no_cache))
     os.makedirs(os.path.dirname(args.output), exist_ok=True) if os.path.dirname(args.output) else None
-    out_df.to_excel(args.output, index=False)
+    write_excel(out_df, args.output)
     print(f"Saved: {args.output}")
 
-def run_gui():
+def run_gui(workers: Optional[int] = None, use_cache: bool = True):
+    import multiprocessing
+    import threading
     import tkinter as tk
     from tkinter import filedialog, messagebox
     root = tk.Tk(); root.withdraw()
@@ -195,24 +393,49 @@ def run_gui():
     output_path = filedialog.asksaveasfilename(defaultextension=".xlsx", initialfile="final_output.xlsx", filetypes=[("Excel","*.xlsx")])
     if not output_path:
         messagebox.showerror("Error", "No output selected."); return
-    frames = []
-    try:
-        for p in pdfs:
-            frames.append(parse_pdf(p))
-        out_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
-        out_df.to_excel(output_path, index=False)
+    # Parse in a background thread so Tk keeps processing events. Workers are
+    # spawned, not forked: forking this threaded process with a live Tk/X
+    # connection can deadlock.
+    result = {}
+    def work():
+        try:
+            out_df = combine_frames(parse_all(pdfs, workers, use_cache, multiprocessing.get_context("spawn")))
+            write_excel(out_df, output_path)
+        except Exception as e:
+            result["error"] = str(e)
+    worker = threading.Thread(target=work, daemon=True)
+    worker.start()
+    def poll():
+        if worker.is_alive():
+            root.after(200, poll)
+        else:
+            root.quit()
+    root.after(200, poll)
+    root.mainloop()
+    if "error" in result:
+        messagebox.showerror("Error", result["error"])
+    else:
         messagebox.showinfo("Success", f"Saved: {output_path}")
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return n
 
 def main():
     parser = argparse.ArgumentParser(description="Electoral Roll Data Extraction Tool (PDF ➜ Excel)")
     parser.add_argument("--input", type=str, help="Input PDF file or folder path")
-    parser.add_argument("--output", type=str, help="Output Excel file path (e.g., C:\\out\\final_output.xlsx)")
+    parser.add_argument("--output", type=str, help="Output Excel file path (e.g., C:\\out\\final_output.xlsx), or a folder for --format parquet")
+    parser.add_argument("--format", choices=["xlsx", "parquet"], default="xlsx", help="Output format (default: xlsx)")
     parser.add_argument("--gui", action="store_true", help="Launch GUI mode")
+    parser.add_argument("--workers", type=positive_int, default=None, help="Number of parallel worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse every PDF instead of reusing cached results")
     args = parser.parse_args()
     if args.gui:
-        run_gui(); return
+        if args.format != "xlsx":
+            parser.error("--gui only writes Excel; use the command line for --format parquet")
+        run_gui(args.workers, not args.no_cache); return
     if not args.input or not args.output:
         parser.print_help(); sys.exit(1)
     run_cli(args)